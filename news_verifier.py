@@ -1,26 +1,68 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
 
-from newsapi import NewsApiClient
-from bs4 import BeautifulSoup
 import re
 from datetime import datetime, timedelta
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process, utils
 import json
+import orjson
+import copy
+import threading
+import numpy as np
 import logging
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 from config import Config
 import time
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+
+# Regex patterns compiled once at import time
+_WS_RE = re.compile(r"\s+")
+_TRAIL_PUNCT_RE = re.compile(r"[\s\-–—:]+$")
+_TOKEN_RE = re.compile(r"[A-Za-z][\w\-']+")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_LOC_RE = re.compile(r'\b(?:in|at)\s+([A-Z][a-zA-Z\s]+?)(?:[,.]|\s+(?:said|reported|according))')
+
+# Words ignored when extracting search keywords from a headline
+STOP_WORDS = frozenset({
+    'the','a','an','and','or','but','in','on','at','to','for','of','with','by','is','are','was','were','be','been','being',
+    'have','has','had','do','does','did','will','would','could','should','breaking','news','update','report','says','after',
+    'from','as','over','under','into','than','then','new','old','amid','amidst','vs','vs.'
+})
+
+# Minimum fuzzy similarity for a title to count as related; passed to RapidFuzz as
+# score_cutoff so pairs that cannot reach it are abandoned early
+MIN_SIMILARITY = 55
+
+# Only the best-scoring titles from each source are turned into results
+MAX_MATCHES_PER_SOURCE = 20
+
+# details keys set by the sub-verifiers when a source could not be checked
+DEGRADED_MARKERS = ('newsapi_error', 'rss_error', 'failed_feeds', 'fact_check_error', 'failed_fact_check_sites')
+
+# Fact-check ratings treated as an explicit falsehood
+FALSE_RATINGS = frozenset({'false', 'fake', 'pants on fire'})
 
 class NewsVerifier:
     def __init__(self):
         self.config = Config()
-        self.newsapi = None
+        # NewsAPI is queried through self.session; None disables it
+        self.newsapi_key = None
         if self.config.NEWS_API_KEY and self.config.NEWS_API_KEY != '8b335dc6442443eca479b1bf193cfc68':
-            self.newsapi = NewsApiClient(api_key=self.config.NEWS_API_KEY)
+            self.newsapi_key = self.config.NEWS_API_KEY
         self.logger = logging.getLogger(__name__)
         self.session = requests.Session()
+        # Larger keep-alive pool so concurrent fact-check and search requests reuse connections
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -42,9 +84,27 @@ class NewsVerifier:
             'deccanherald.com': 0.7,
             'republicworld.com': 0.4
         }
+        # Recent verification results keyed on the normalized, lowercased headline
+        self._verify_cache = TTLCache(maxsize=512, ttl=3600)
+        self._verify_cache_lock = threading.Lock()
+        # feed_url -> (etag, modified, parsed feed) for conditional RSS requests
+        self._feed_cache = {}
+        # Fact Check API responses and per-site result counts keyed on the search terms
+        self._factcheck_api_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._site_search_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._factcheck_cache_lock = threading.Lock()
         
     def verify_headline(self, headline):
         """Main verification function"""
+        cache_key = self._normalize_text(headline).lower()
+        with self._verify_cache_lock:
+            cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Returning cached verification result")
+            cached_result = copy.deepcopy(cached)
+            cached_result['headline'] = headline
+            return cached_result
+        
         verification_result = {
             'headline': headline,
             'authenticity_score': 0,
@@ -68,12 +128,16 @@ class NewsVerifier:
         
         try:
             normalized_headline = self._normalize_text(headline)
+            # Lowercase/strip the query once; titles are processed per feed and scored with processor=None
+            processed_headline = utils.default_process(normalized_headline)
+            # Titles syndicated across NewsAPI and several feeds are only scored once per call
+            title_scores = {}
             # Step 1: Search using NewsAPI (if available)
-            if self.newsapi:
-                verification_result = self._verify_with_newsapi(normalized_headline, verification_result)
+            if self.newsapi_key:
+                verification_result = self._verify_with_newsapi(normalized_headline, processed_headline, title_scores, verification_result)
             
             # Step 2: Search using RSS feeds and web scraping
-            verification_result = self._verify_with_rss_feeds(normalized_headline, verification_result)
+            verification_result = self._verify_with_rss_feeds(normalized_headline, processed_headline, title_scores, verification_result)
             
             # Step 3: Check fact-checking websites
             verification_result = self._check_fact_checking_sites(normalized_headline, verification_result)
@@ -88,10 +152,17 @@ class NewsVerifier:
             self.logger.error(f"Error in headline verification: {str(e)}")
             verification_result['verification_status'] = 'Error'
             verification_result['error'] = str(e)
+        else:
+            # Don't cache degraded runs (any source failed or nothing was reachable)
+            details = verification_result['details']
+            degraded = any(details.get(marker) for marker in DEGRADED_MARKERS)
+            if not degraded and details['total_sources_checked'] > 0:
+                with self._verify_cache_lock:
+                    self._verify_cache[cache_key] = copy.deepcopy(verification_result)
         
         return verification_result
     
-    def _verify_with_newsapi(self, headline, result):
+    def _verify_with_newsapi(self, headline, processed_headline, title_scores, result):
         """Verify headline using NewsAPI"""
         try:
             self.logger.info("Verifying with NewsAPI...")
@@ -113,32 +184,37 @@ class NewsVerifier:
             
             # Search for articles
             date_from = (datetime.utcnow() - timedelta(days=14)).strftime('%Y-%m-%d')
-            articles = self.newsapi.get_everything(
-                q=search_query,
-                language='en',
-                sort_by='relevancy',
-                from_param=date_from,
-                page_size=50
+            # Call the endpoint on the pooled session and decode with orjson
+            resp = self.session.get(
+                'https://newsapi.org/v2/everything',
+                params={
+                    'q': search_query,
+                    'language': 'en',
+                    'sortBy': 'relevancy',
+                    'from': date_from,
+                    'pageSize': 50
+                },
+                headers={'X-Api-Key': self.newsapi_key},
+                timeout=10
             )
+            articles = orjson.loads(resp.content)
+            if articles.get('status') != 'ok':
+                raise ValueError(articles.get('message') or f"HTTP {resp.status_code}")
             
             result['details']['total_sources_checked'] += len(articles['articles'])
             
+            # Score every title against the headline in a single batched call
+            articles_list = articles['articles']
+            processed_titles = [utils.default_process(article['title'] or '') for article in articles_list]
+            scores = self._score_titles(processed_headline, processed_titles, title_scores)
+
             seen_urls = set()
-            for article in articles['articles']:
+            seen_titles = set()
+            # Only walk the best-scoring matches, highest first
+            for idx in self._top_matches(scores):
                 try:
-                    # Use multiple similarity methods for better matching
-                    title = article['title'].lower()
-                    headline_lower = headline.lower()
-                    
-                    ratio = fuzz.ratio(headline_lower, title)
-                    partial = fuzz.partial_ratio(headline_lower, title)
-                    token_sort = fuzz.token_sort_ratio(headline_lower, title)
-                    
-                    # Use the highest similarity score
-                    similarity = max(ratio, partial, token_sort)
-                    # Skip low similarity early
-                    if similarity < 55:
-                        continue
+                    article = articles_list[idx]
+                    similarity = int(scores[idx])
 
                     # Basic recency check (prefer last 21 days)
                     published_at = article.get('publishedAt')
@@ -158,12 +234,17 @@ class NewsVerifier:
                     seen_urls.add(url)
 
                     # Domain reputation weight
-                    domain = urlparse(url).netloc.replace('www.', '')
+                    domain = self._host_from_url(url)
                     reputation_weight = self.domain_weights.get(domain, 0.5)
 
-                    self.logger.info(f"Article similarity: {similarity}% (ratio:{ratio}, partial:{partial}, token:{token_sort}) - {article['title'][:50]}...")
+                    self.logger.info(f"Article similarity: {similarity}% - {article['title'][:50]}...")
                     
                     if similarity >= 62 and is_recent:
+                        # Skip the same story already picked up from this domain
+                        title_key = (processed_titles[idx], domain)
+                        if title_key in seen_titles:
+                            continue
+                        seen_titles.add(title_key)
                         self.logger.info(f"Adding matching source: {article['source']['name']}")
                         result['sources_found'].append({
                             'source': article['source']['name'],
@@ -193,32 +274,50 @@ class NewsVerifier:
         
         return result
     
-    def _verify_with_rss_feeds(self, headline, result):
+    def _verify_with_rss_feeds(self, headline, processed_headline, title_scores, result):
         """Verify headline using RSS feeds and web scraping"""
         try:
             self.logger.info("Verifying with RSS feeds...")
             result['details']['verification_method'].append('RSS_Feeds')
             
             keywords = self._extract_keywords(headline)
+            # Content-word set used to skip entries that share nothing with the headline
+            # (short fragments like the 's' in "rain's" would let almost any title through)
+            keyword_tokens = {t for t in _WORD_RE.findall(' '.join(keywords).lower()) if len(t) > 2}
+            
+            # Skip articles already collected from NewsAPI or an earlier feed
+            seen_urls = {s['url'] for s in result['sources_found']}
+            seen_titles = {(utils.default_process(s['title']), s['domain']) for s in result['sources_found']}
+            
+            # Feeds are independent, so fetch them concurrently and score them serially
+            feed_urls = self.config.NEWS_SOURCES
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                feeds = list(executor.map(self._fetch_feed, feed_urls))
             
-            for feed_url in self.config.NEWS_SOURCES:
+            for feed_url, feed in zip(feed_urls, feeds):
+                if feed is None:
+                    result['details'].setdefault('failed_feeds', []).append(feed_url)
+                    continue
                 try:
-                    feed = feedparser.parse(feed_url)
                     result['details']['total_sources_checked'] += len(feed.entries)
                     
-                    for entry in feed.entries:
-                        # Use multiple similarity methods for better matching
-                        entry_title = entry.title.lower()
-                        headline_lower = headline.lower()
-                        
-                        ratio = fuzz.ratio(headline_lower, entry_title)
-                        partial = fuzz.partial_ratio(headline_lower, entry_title)
-                        token_sort = fuzz.token_sort_ratio(headline_lower, entry_title)
-                        
-                        # Use the highest similarity score
-                        similarity = max(ratio, partial, token_sort)
-                        if similarity < 55:
-                            continue
+                    # Only entries sharing at least one keyword go on to fuzzy scoring
+                    if keyword_tokens:
+                        candidates = [
+                            entry for entry in feed.entries
+                            if not keyword_tokens.isdisjoint(_WORD_RE.findall(entry.get('title', '').lower()))
+                        ]
+                    else:
+                        candidates = feed.entries
+                    
+                    # Score every candidate title against the headline in a single batched call
+                    processed_titles = [utils.default_process(entry.get('title', '')) for entry in candidates]
+                    scores = self._score_titles(processed_headline, processed_titles, title_scores)
+
+                    # Only walk the best-scoring matches, highest first
+                    for idx in self._top_matches(scores):
+                        entry = candidates[idx]
+                        similarity = int(scores[idx])
 
                         # Recency filter: last 21 days if published
                         published = entry.get('published', '')
@@ -232,10 +331,17 @@ class NewsVerifier:
                             pass
 
                         url = entry.link
-                        domain = urlparse(url).netloc.replace('www.', '')
+                        if url in seen_urls:
+                            continue
+                        domain = self._host_from_url(url)
+                        title_key = (processed_titles[idx], domain)
+                        if title_key in seen_titles:
+                            continue
                         reputation_weight = self.domain_weights.get(domain, 0.5)
 
                         if is_recent:
+                            seen_urls.add(url)
+                            seen_titles.add(title_key)
                             result['sources_found'].append({
                                 'source': feed.feed.get('title', 'RSS Feed'),
                                 'title': entry.title,
@@ -257,13 +363,56 @@ class NewsVerifier:
                 
                 except Exception as e:
                     self.logger.warning(f"Failed to parse RSS feed {feed_url}: {str(e)}")
+                    result['details'].setdefault('failed_feeds', []).append(feed_url)
                     continue
                     
         except Exception as e:
             self.logger.error(f"RSS feed verification failed: {str(e)}")
+            result['details']['rss_error'] = str(e)
         
         return result
     
+    def _score_titles(self, processed_headline, processed_titles, title_scores):
+        """Score processed titles against the headline, reusing scores already in title_scores"""
+        unseen = list(dict.fromkeys(t for t in processed_titles if t not in title_scores))
+        if unseen:
+            scores = process.cdist(
+                [processed_headline], unseen,
+                scorer=fuzz.WRatio,
+                processor=None,
+                score_cutoff=MIN_SIMILARITY,
+                dtype=np.uint8,
+                workers=-1
+            )[0]
+            title_scores.update(zip(unseen, scores.tolist()))
+        return np.array([title_scores[t] for t in processed_titles], dtype=np.uint8)
+    
+    def _top_matches(self, scores, limit=MAX_MATCHES_PER_SOURCE):
+        """Return indices of the highest non-zero scores, best first, ties in original order"""
+        # Scores below the cutoff come back as 0
+        matched = np.flatnonzero(scores)
+        order = np.argsort(-scores[matched].astype(np.int16), kind='stable')
+        return matched[order[:limit]]
+    
+    def _fetch_feed(self, feed_url):
+        """Fetch and parse a single RSS feed, returning None on failure"""
+        try:
+            etag, modified, cached_feed = self._feed_cache.get(feed_url, (None, None, None))
+            feed = feedparser.parse(feed_url, etag=etag, modified=modified)
+            # 304 Not Modified comes back with no entries, so reuse the last parsed copy
+            if feed.get('status') == 304 and cached_feed is not None:
+                return cached_feed
+            # feedparser reports network and parse failures via bozo instead of raising
+            if feed.get('bozo') and not feed.entries:
+                self.logger.warning(f"Failed to fetch RSS feed {feed_url}: {feed.get('bozo_exception')}")
+                return None
+            if feed.get('status') == 200 and (feed.get('etag') or feed.get('modified')):
+                self._feed_cache[feed_url] = (feed.get('etag'), feed.get('modified'), feed)
+            return feed
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch RSS feed {feed_url}: {str(e)}")
+            return None
+    
     def _check_fact_checking_sites(self, headline, result):
         """Check fact-checking websites"""
         try:
@@ -273,63 +422,109 @@ class NewsVerifier:
             keywords = self._extract_keywords(headline)
             search_terms = ' '.join(keywords[:3])
             
-            # Try Google Fact Check API first if available
-            if self.config.GOOGLE_API_KEY:
-                try:
-                    api_url = (
-                        f"https://factchecktools.googleapis.com/v1alpha1/claims:search?query={requests.utils.quote(search_terms)}"
-                        f"&pageSize=5&key={self.config.GOOGLE_API_KEY}"
-                    )
-                    resp = self.session.get(api_url, timeout=10)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        claims = data.get('claims', [])
-                        if claims:
-                            result['details']['fact_check_results'].append({
-                                'site': 'Google Fact Check API',
-                                'results_found': len(claims),
-                                'status': 'Found related fact-checks'
-                            })
-                            # If any claim rated false, record
-                            for claim in claims:
-                                reviews = claim.get('claimReview', [])
-                                for review in reviews:
-                                    text_rating = review.get('textualRating', '').lower()
-                                    publisher = review.get('publisher', {}).get('name', '')
-                                    url = review.get('url')
-                                    result['details']['fact_check_results'].append({
-                                        'site': publisher or 'Fact-check',
-                                        'rating': text_rating,
-                                        'url': url
-                                    })
-                except Exception as e:
-                    self.logger.warning(f"Fact Check API failed: {e}")
+            # Fire the Fact Check API and per-site searches concurrently
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                api_future = None
+                if self.config.GOOGLE_API_KEY:
+                    api_future = executor.submit(self._fetch_fact_check_claims, search_terms)
+                
+                site_futures = [
+                    (fact_site, executor.submit(self._fetch_site_result_count, fact_site, search_terms))
+                    for fact_site in self.config.FACT_CHECK_SOURCES
+                ]
+                
+                # Try Google Fact Check API first if available
+                if api_future is not None:
+                    try:
+                        data = api_future.result()
+                        if data is None:
+                            result['details']['fact_check_error'] = 'Fact Check API request failed'
+                        else:
+                            claims = data.get('claims', [])
+                            if claims:
+                                result['details']['fact_check_results'].append({
+                                    'site': 'Google Fact Check API',
+                                    'results_found': len(claims),
+                                    'status': 'Found related fact-checks'
+                                })
+                                # If any claim rated false, record
+                                for claim in claims:
+                                    reviews = claim.get('claimReview', [])
+                                    for review in reviews:
+                                        text_rating = review.get('textualRating', '').lower()
+                                        publisher = review.get('publisher', {}).get('name', '')
+                                        url = review.get('url')
+                                        result['details']['fact_check_results'].append({
+                                            'site': publisher or 'Fact-check',
+                                            'rating': text_rating,
+                                            'url': url
+                                        })
+                    except Exception as e:
+                        self.logger.warning(f"Fact Check API failed: {e}")
+                        result['details']['fact_check_error'] = str(e)
 
-            for fact_site in self.config.FACT_CHECK_SOURCES:
-                try:
-                    # Simple Google search for fact-check results
-                    search_url = f"https://www.google.com/search?q=site:{fact_site}+{requests.utils.quote(search_terms)}"
-                    response = self.session.get(search_url, timeout=10)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        search_results = soup.find_all('h3')
-                        
-                        if len(search_results) > 0:
+                for fact_site, future in site_futures:
+                    try:
+                        h3_count = future.result()
+                        if h3_count is None:
+                            result['details'].setdefault('failed_fact_check_sites', []).append(fact_site)
+                        elif h3_count:
                             result['details']['fact_check_results'].append({
                                 'site': fact_site,
-                                'results_found': len(search_results),
+                                'results_found': h3_count,
                                 'status': 'Found related fact-checks'
                             })
-                
-                except Exception as e:
-                    self.logger.warning(f"Failed to check {fact_site}: {str(e)}")
-                    continue
+                    
+                    except Exception as e:
+                        self.logger.warning(f"Failed to check {fact_site}: {str(e)}")
+                        result['details'].setdefault('failed_fact_check_sites', []).append(fact_site)
+                        continue
                     
         except Exception as e:
             self.logger.error(f"Fact-checking failed: {str(e)}")
+            result['details']['fact_check_error'] = str(e)
         
         return result
     
+    def _fetch_fact_check_claims(self, search_terms):
+        """Query the Google Fact Check API, returning the decoded response or None"""
+        key = search_terms.lower()
+        with self._factcheck_cache_lock:
+            cached = self._factcheck_api_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        api_url = (
+            f"https://factchecktools.googleapis.com/v1alpha1/claims:search?query={requests.utils.quote(search_terms)}"
+            f"&pageSize=5&key={self.config.GOOGLE_API_KEY}"
+        )
+        resp = self.session.get(api_url, timeout=10)
+        if resp.status_code != 200:
+            return None
+        data = orjson.loads(resp.content)
+        with self._factcheck_cache_lock:
+            self._factcheck_api_cache[key] = data
+        return data
+    
+    def _fetch_site_result_count(self, fact_site, search_terms):
+        """Count Google results for a fact-check site, returning None if the search failed"""
+        key = (fact_site, search_terms.lower())
+        with self._factcheck_cache_lock:
+            cached = self._site_search_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Simple Google search for fact-check results
+        search_url = f"https://www.google.com/search?q=site:{fact_site}+{requests.utils.quote(search_terms)}"
+        response = self.session.get(search_url, timeout=10)
+        if response.status_code != 200:
+            return None
+        # Only the number of result headings is needed, so count them in the raw bytes
+        h3_count = response.content.count(b'<h3')
+        with self._factcheck_cache_lock:
+            self._site_search_cache[key] = h3_count
+        return h3_count
+    
     def _calculate_authenticity_score(self, result):
         """Calculate overall authenticity score"""
         score = 0
@@ -345,21 +540,27 @@ class NewsVerifier:
         elif matching_sources >= 1:
             score += 12
         
-        # Score from similarity scores
-        if result['similar_headlines']:
-            avg_similarity = sum(h['similarity'] for h in result['similar_headlines']) / len(result['similar_headlines'])
-            score += int(min(40, max(0, (avg_similarity - 55) * 0.8)))  # scaled from threshold
-        
-        # Score from reputable sources (domain-based weighting)
+        # sources_found and similar_headlines are appended together, so one pass over
+        # sources_found gives both the average similarity and the best reputation weight
         if result['sources_found']:
-            max_rep_weight = max(s.get('reputation_weight', 0.5) for s in result['sources_found'])
+            total_similarity = 0
+            max_rep_weight = 0.0
+            for source in result['sources_found']:
+                total_similarity += source['similarity_score']
+                max_rep_weight = max(max_rep_weight, source.get('reputation_weight', 0.5))
+            
+            # Score from similarity scores
+            avg_similarity = total_similarity / len(result['sources_found'])
+            score += int(min(40, max(0, (avg_similarity - MIN_SIMILARITY) * 0.8)))  # scaled from threshold
+            
+            # Score from reputable sources (domain-based weighting)
             score += int(15 * max_rep_weight)
         
         # Score from fact-checking results
         if result['details']['fact_check_results']:
             # Penalize if any explicit false ratings found
             has_false = any(
-                (isinstance(item, dict) and str(item.get('rating', '')).lower() in {'false', 'fake', 'pants on fire'})
+                (isinstance(item, dict) and str(item.get('rating', '')).lower() in FALSE_RATINGS)
                 for item in result['details']['fact_check_results']
             )
             if has_false:
@@ -413,7 +614,7 @@ class NewsVerifier:
         description = best_source.get('description', '')
         if description:
             # Simple location extraction (can be improved with NLP)
-            locations = re.findall(r'\b(?:in|at)\s+([A-Z][a-zA-Z\s]+?)(?:[,.]|\s+(?:said|reported|according))', description)
+            locations = _LOC_RE.findall(description)
             if locations:
                 result['summary']['where_happened'] = f"Location mentioned: {locations[0].strip()}"
             else:
@@ -429,43 +630,45 @@ class NewsVerifier:
     
     def _extract_keywords(self, text):
         """Extract keywords from text"""
-        # Remove common stop words and extract meaningful terms
-        stop_words = {
-            'the','a','an','and','or','but','in','on','at','to','for','of','with','by','is','are','was','were','be','been','being',
-            'have','has','had','do','does','did','will','would','could','should','breaking','news','update','report','says','after',
-            'from','as','over','under','into','than','then','new','old','amid','amidst','vs','vs.'
-        }
-
-        # Preserve original case for proper noun detection
-        original_tokens = re.findall(r"[A-Za-z][\w\-']+", text)
-        lower_tokens = [t.lower() for t in original_tokens]
-
-        # Unigrams excluding stopwords
-        unigrams = [t for t in lower_tokens if t not in stop_words and len(t) > 2]
-
-        # Simple proper noun capture (capitalized words in original)
-        proper_nouns = [t for t in original_tokens if t[:1].isupper() and t.lower() not in stop_words]
-
-        # Bigrams of informative words
-        bigrams = []
-        for i in range(len(unigrams) - 1):
-            if unigrams[i] not in stop_words and unigrams[i+1] not in stop_words:
-                bigrams.append(f"{unigrams[i]} {unigrams[i+1]}")
+        # Single pass over tokens; dicts keep first-seen order and dedupe each group
+        proper_nouns = {}
+        bigrams = {}
+        unigrams = {}
+        previous = None
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group()
+            lower = token.lower()
+            if lower in STOP_WORDS:
+                continue
+            # Simple proper noun capture (capitalized words in original)
+            if token[0].isupper():
+                proper_nouns[lower] = None
+            if len(lower) > 2:
+                # Bigrams of consecutive informative words
+                if previous is not None:
+                    bigrams[f"{previous} {lower}"] = None
+                unigrams[lower] = None
+                previous = lower
 
         # Priority: proper nouns and bigrams, then unigrams
-        prioritized = []
-        prioritized.extend(list(dict.fromkeys([p.lower() for p in proper_nouns])))
-        prioritized.extend(list(dict.fromkeys(bigrams)))
-        prioritized.extend(list(dict.fromkeys(unigrams)))
+        prioritized = list(proper_nouns) + list(bigrams) + list(unigrams)
 
         # Return top tokens/phrases
         return prioritized[:10]
 
+    def _host_from_url(self, url: str) -> str:
+        """Return the lowercased host of a URL without a leading 'www.'."""
+        # Cheaper than urlparse, which builds a full ParseResult per article
+        host = url.partition('://')[2]
+        for sep in '/?#':
+            host = host.partition(sep)[0]
+        return host.lower().removeprefix('www.')
+
     def _normalize_text(self, text: str) -> str:
         """Normalize headline text for comparison and search."""
         if not text:
             return ''
-        cleaned = re.sub(r"\s+", " ", text).strip()
+        cleaned = _WS_RE.sub(" ", text).strip()
         # Remove trailing punctuation that often varies across outlets
-        cleaned = re.sub(r"[\s\-–—:]+$", "", cleaned)
+        cleaned = _TRAIL_PUNCT_RE.sub("", cleaned)
         return cleaned